@@ -417,3 +417,10 @@ class ApiCallRouterWithoutChecks(api_call_router.ApiCallRouterStub):
       token: Optional[access_control.ACLToken] = None,
   ) -> api_metadata.ApiGetGrrVersionHandler:
     return api_metadata.ApiGetGrrVersionHandler()
+
+  def GetOpenApiDescription(
+      self,
+      args: None,
+      token: Optional[access_control.ACLToken] = None,
+  ) -> api_metadata.ApiGetOpenApiDescriptionHandler:
+    return api_metadata.ApiGetOpenApiDescriptionHandler(self)
@@ -1,7 +1,21 @@
 #!/usr/bin/env python
 # Lint as: python3
 """A module with API methods related to the GRR metadata."""
+import functools
+import json
+import re
+import sys
+import threading
+
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import List
 from typing import Optional
+from typing import Tuple
+from urllib import parse as urlparse
+
+from google.protobuf import descriptor
 
 from grr_response_core import version
 from grr_response_core.lib.rdfvalues import structs as rdf_structs
@@ -9,6 +23,262 @@ from grr_response_proto.api import metadata_pb2
 from grr_response_server import access_control
 from grr_response_server.gui import api_call_handler_base
 
+try:
+  # `orjson` is a C JSON serializer which is significantly faster than the
+  # pure-Python stdlib one on dict-heavy payloads such as the OpenAPI
+  # description. It is an optional dependency: if it is not available, the
+  # stdlib `json` module is used instead.
+  import orjson
+except ImportError:
+  orjson = None
+
+# Type aliases used by the OpenAPI description generator.
+Descriptor = descriptor.Descriptor
+EnumDescriptor = descriptor.EnumDescriptor
+FieldDescriptor = descriptor.FieldDescriptor
+
+# Maps router classes to their serialized OpenAPI descriptions. The OpenAPI
+# description depends only on the router class, so it is shared by all the
+# handler instances of the process, not rebuilt per handler instance.
+_openapi_descriptions: Dict[type, str] = {}
+
+# Guards the one-shot builds of the OpenAPI descriptions stored in
+# `_openapi_descriptions`.
+_openapi_descriptions_lock = threading.Lock()
+
+
+# Matches a Werkzeug path argument, with or without a converter specification,
+# e.g. `<client_id>` or `<path:file_path>`, capturing the argument name.
+_PATH_ARG_REGEX = re.compile(r"<(?:[^:>]+:)?([^>]+)>")
+
+# Translates route paths to the form used in `operationId` fields: one
+# C-level pass instead of a chain of `str.replace` calls.
+_OPERATION_ID_TRANSLATION = str.maketrans({
+    "/": "-",
+    "<": "_",
+    ">": "_",
+    ":": "-",
+})
+
+# Maps `protobuf.FieldDescriptor.type` values to the type names used
+# throughout the OpenAPI description. Built once at import time so that
+# `_GetTypeName` reduces to a single dictionary lookup for scalar fields.
+_PROTOBUF_TYPES_NAMES = {
+    FieldDescriptor.TYPE_DOUBLE: "protobuf2.TYPE_DOUBLE",
+    FieldDescriptor.TYPE_FLOAT: "protobuf2.TYPE_FLOAT",
+    FieldDescriptor.TYPE_INT64: "protobuf2.TYPE_INT64",
+    FieldDescriptor.TYPE_UINT64: "protobuf2.TYPE_UINT64",
+    FieldDescriptor.TYPE_INT32: "protobuf2.TYPE_INT32",
+    FieldDescriptor.TYPE_FIXED64: "protobuf2.TYPE_FIXED64",
+    FieldDescriptor.TYPE_FIXED32: "protobuf2.TYPE_FIXED32",
+    FieldDescriptor.TYPE_BOOL: "protobuf2.TYPE_BOOL",
+    FieldDescriptor.TYPE_STRING: "protobuf2.TYPE_STRING",
+    FieldDescriptor.TYPE_BYTES: "protobuf2.TYPE_BYTES",
+    FieldDescriptor.TYPE_UINT32: "protobuf2.TYPE_UINT32",
+    FieldDescriptor.TYPE_SFIXED32: "protobuf2.TYPE_SFIXED32",
+    FieldDescriptor.TYPE_SFIXED64: "protobuf2.TYPE_SFIXED64",
+    FieldDescriptor.TYPE_SINT32: "protobuf2.TYPE_SINT32",
+    FieldDescriptor.TYPE_SINT64: "protobuf2.TYPE_SINT64",
+}
+
+# The version of the OpenAPI Specification that the rendered description
+# follows.
+_OPENAPI_SPECIFICATION_VERSION = "3.0.3"
+
+# The static fields of the `info` object of the OpenAPI description. The GRR
+# version is added to a copy of this object by `_SetMetadata`.
+_INFO_OBJ = {
+    "title": "GRR Rapid Response API",
+    "description": ("GRR Rapid Response is an incident response framework "
+                    "focused on remote live forensics."),
+    "contact": {
+        "name": "GRR GitHub Repository",
+        "url": "https://github.com/google/grr",
+    },
+    "license": {
+        "name": "Apache 2.0",
+        "url": "http://www.apache.org/licenses/LICENSE-2.0",
+    },
+}
+
+# The `servers` object of the OpenAPI description.
+_SERVERS_OBJ = [{
+    "url": "/",
+    "description": "Root path of the GRR API",
+}]
+
+# The OpenAPI schemas of the "primitive" types: the protobuf scalar types and
+# the GRR `BinaryStream` pseudotype. These are fully static, so one table is
+# built at import and shared; `_ExtractSchemas` seeds the per-description
+# schemas collection with a shallow copy of it and the schemas end up in the
+# `components` object, referenced from their usage sites. 64-bit integer
+# types are described as strings, as they are rendered that way by the JSON
+# API to avoid precision loss in JavaScript consumers.
+_PRIMITIVE_TYPES_SCHEMAS = {
+    "protobuf2.TYPE_DOUBLE": {
+        "type": "number",
+        "format": "double"
+    },
+    "protobuf2.TYPE_FLOAT": {
+        "type": "number",
+        "format": "float"
+    },
+    "protobuf2.TYPE_INT64": {
+        "type": "string",
+        "format": "int64"
+    },
+    "protobuf2.TYPE_UINT64": {
+        "type": "string",
+        "format": "uint64"
+    },
+    "protobuf2.TYPE_INT32": {
+        "type": "integer",
+        "format": "int32"
+    },
+    "protobuf2.TYPE_FIXED64": {
+        "type": "string",
+        "format": "uint64"
+    },
+    "protobuf2.TYPE_FIXED32": {
+        "type": "integer",
+        "format": "uint32"
+    },
+    "protobuf2.TYPE_BOOL": {
+        "type": "boolean"
+    },
+    "protobuf2.TYPE_STRING": {
+        "type": "string"
+    },
+    "protobuf2.TYPE_BYTES": {
+        "type": "string",
+        "format": "byte"
+    },
+    "protobuf2.TYPE_UINT32": {
+        "type": "integer",
+        "format": "uint32"
+    },
+    "protobuf2.TYPE_SFIXED32": {
+        "type": "integer",
+        "format": "int32"
+    },
+    "protobuf2.TYPE_SFIXED64": {
+        "type": "string",
+        "format": "int64"
+    },
+    "protobuf2.TYPE_SINT32": {
+        "type": "integer",
+        "format": "int32"
+    },
+    "protobuf2.TYPE_SINT64": {
+        "type": "string",
+        "format": "int64"
+    },
+    "BinaryStream": {
+        "type": "string",
+        "format": "binary"
+    },
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _ParsePath(path: str) -> Tuple[str, FrozenSet[str]]:
+  """Parses a Werkzeug route into its OpenAPI path and path argument names.
+
+  The route is scanned once: Werkzeug path arguments (with or without a
+  converter specification) are rewritten to OpenAPI curly brace syntax and
+  their names are collected along the way. Routes are shared between HTTP
+  verbs and handler builds, so results are memoized per unique path.
+
+  Args:
+    path: The Werkzeug route path to parse.
+
+  Returns:
+    A tuple of the simplified path (Werkzeug converters and arrow brackets
+    replaced by OpenAPI curly braces) and the frozenset of the path argument
+    names. The names are only membership-tested by callers, hence the
+    frozenset.
+  """
+  simple_nodes = []
+  path_args = []
+
+  last_end = 0
+  for match in _PATH_ARG_REGEX.finditer(path):
+    arg_name = match.group(1)
+    simple_nodes.append(path[last_end:match.start()])
+    simple_nodes.append(f"{{{arg_name}}}")
+    path_args.append(arg_name)
+    last_end = match.end()
+  simple_nodes.append(path[last_end:])
+
+  return "".join(simple_nodes), frozenset(path_args)
+
+
+@functools.lru_cache(maxsize=None)
+def _GetTypeName(cls: Any) -> str:
+  """Extracts the type name of an (often protobuf related) type object.
+
+  The function is called once per field during schema extraction and per
+  parameter/response during endpoint description. Protobuf descriptors are
+  per-type singletons, so the memoization turns all but the first call for
+  a given type into a single cache lookup.
+  """
+  if isinstance(cls, FieldDescriptor):
+    # Flat dispatch: resolve the field's type directly instead of recursing
+    # into the respective descriptor branches.
+    message_type = cls.message_type  # None if the field is not a message.
+    if message_type is not None:
+      return message_type.full_name
+
+    enum_type = cls.enum_type  # None if the field is not an enum.
+    if enum_type is not None:
+      return enum_type.full_name
+
+    return _PROTOBUF_TYPES_NAMES[cls.type]
+
+  if isinstance(cls, Descriptor):
+    return cls.full_name
+
+  if isinstance(cls, EnumDescriptor):
+    return cls.full_name
+
+  if isinstance(cls, type):
+    return cls.__name__
+
+  if isinstance(cls, int):  # It's a `protobuf.FieldDescriptor.type` value.
+    return _PROTOBUF_TYPES_NAMES[cls]
+
+  return str(cls)  # Cover `BinaryStream` and `None`.
+
+
+@functools.lru_cache(maxsize=None)
+def _GetSchemaOrReferenceObject(
+    type_name: str,
+    is_array: bool = False,
+) -> Dict[str, Any]:
+  """Gets the reference object of a type from the `components` object.
+
+  Every type, primitives included, has its schema emitted once in the
+  `components` object and is referenced from its usage sites, so each
+  field costs one small `$ref` dict in the serialized description rather
+  than a copy of the whole schema. The result depends only on the
+  arguments, is never mutated after being built and is aliased freely by
+  the JSON serializer, so each distinct `(type_name, is_array)` pair
+  allocates its dict only once per process.
+  """
+  # Fields of the same type each build this reference string; interning
+  # it deduplicates the copies across the whole description and makes
+  # later dict operations on it plain pointer comparisons. Literal keys
+  # and values are interned by CPython already.
+  ref_obj = {"$ref": sys.intern(f"#/components/schemas/{type_name}")}
+
+  if is_array:
+    return {
+        "type": "array",
+        "items": ref_obj,
+    }
+
+  return ref_obj
+
 
 class ApiGetGrrVersionResult(rdf_structs.RDFProtoStruct):
   """An RDF wrapper for result of the API method for getting GRR version."""
@@ -37,3 +307,410 @@ class ApiGetGrrVersionHandler(api_call_handler_base.ApiCallHandler):
     result.revision = version_dict["revision"]
     result.release = version_dict["release"]
     return result
+
+
+class ApiGetOpenApiDescriptionResult(rdf_structs.RDFProtoStruct):
+  """An RDF wrapper for the OpenAPI description of the GRR API."""
+
+  protobuf = metadata_pb2.ApiGetOpenApiDescriptionResult
+  rdf_deps = []
+
+
+class ApiGetOpenApiDescriptionHandler(api_call_handler_base.ApiCallHandler):
+  """Renders a description of the GRR API using the OpenAPI Specification."""
+
+  args_type = None
+  result_type = ApiGetOpenApiDescriptionResult
+
+  def __init__(self, router: Any) -> None:
+    # TODO(user): Remove the dependency cycle between this module and
+    # `api_call_router.py` and then annotate `router` as an `ApiCallRouter`.
+    super().__init__()
+    self.router = router
+    self.openapi_obj: Optional[Dict[str, Any]] = None
+    self.schema_objs: Optional[Dict[str, Dict[str, Any]]] = None
+    # The serialized OpenAPI description is produced at handler construction
+    # (i.e. router setup) rather than on the first request, so no request
+    # pays the build cost. The per-router-class cache makes this a single
+    # dict lookup for every handler but the first one of a router class.
+    self.openapi_json: str = self._GetOrBuildOpenApiJson()
+
+  def _ExtractEnumSchema(
+      self,
+      enum: EnumDescriptor,
+  ) -> Dict[str, Any]:
+    """Extracts OpenAPI schema of a protobuf enum."""
+    enum_schema_obj = {
+        "type": "integer",
+        "format": "int32",
+    }
+
+    if enum.values:
+      # Both the allowed numbers and the description lines come from the
+      # same values, so they are collected in a single pass.
+      numbers = []
+      description_lines = []
+      for value in enum.values:
+        numbers.append(value.number)
+        description_lines.append(f"{value.number} == {value.name}")
+
+      enum_schema_obj["enum"] = tuple(numbers)
+      enum_schema_obj["description"] = "\n".join(description_lines)
+    else:
+      enum_schema_obj["enum"] = ()
+
+    self.schema_objs[_GetTypeName(enum)] = enum_schema_obj
+
+    return enum_schema_obj
+
+  def _ExtractMessageSchema(
+      self,
+      message: Descriptor,
+      worklist: List[Any],
+  ) -> Dict[str, Any]:
+    """Extracts OpenAPI schema of a protobuf message.
+
+    Message and enum types referenced by the fields are appended to `worklist`
+    to be extracted by the caller, instead of being visited recursively. This
+    is safe because fields always reference the schemas of their types by
+    name, so a message schema never needs the schemas of its dependencies to
+    be complete.
+
+    Args:
+      message: The protobuf message `Descriptor` whose schema is extracted.
+      worklist: The worklist on which referenced types are pushed.
+
+    Returns:
+      The schema object of the protobuf message.
+    """
+    # Loop-invariant lookups, hoisted out of the (hot) fields loop.
+    get_type_name = _GetTypeName
+    get_schema_or_ref = _GetSchemaOrReferenceObject
+    label_repeated = FieldDescriptor.LABEL_REPEATED
+    worklist_append = worklist.append
+
+    properties = {}
+    for field_descriptor in message.fields:
+      # `message_type`/`enum_type` are None unless the field is of the
+      # respective kind; each descriptor attribute is fetched only once.
+      referenced_type = (
+          field_descriptor.message_type or field_descriptor.enum_type)
+      if referenced_type is not None:
+        worklist_append(referenced_type)
+
+      properties[field_descriptor.name] = get_schema_or_ref(
+          get_type_name(field_descriptor),
+          field_descriptor.label == label_repeated)
+
+    message_schema_obj = {
+        "type": "object",
+        "properties": properties,
+    }
+    self.schema_objs[get_type_name(message)] = message_schema_obj
+
+    return message_schema_obj
+
+  def _ExtractSchema(self, cls: Any) -> None:
+    """Builds the OpenAPI schemas of a type and of all its dependencies.
+
+    The type graph is traversed iteratively with an explicit worklist, rather
+    than recursively: deeply nested protobuf types would otherwise pay for a
+    Python frame per field, and already-extracted types are skipped with a
+    single dict lookup in `self.schema_objs`, which also breaks dependency
+    cycles between message types.
+
+    Args:
+      cls: The type whose schema (and dependencies' schemas) are extracted.
+
+    Raises:
+      ValueError: If `cls` is `None`.
+      TypeError: If the schema of `cls` cannot be extracted.
+    """
+    if cls is None:
+      raise ValueError("Trying to extract schema of None.")
+
+    # `isinstance(cls, type)` is `inspect.isclass` without the pure-Python
+    # wrapper call.
+    if isinstance(cls, type) and issubclass(cls, rdf_structs.RDFProtoStruct):
+      cls = cls.protobuf.DESCRIPTOR
+
+    schema_objs = self.schema_objs  # Cached for the traversal loop.
+    get_type_name = _GetTypeName
+
+    worklist = [cls]
+    while worklist:
+      current = worklist.pop()
+      type_name = get_type_name(current)
+      # "Primitive" types and already-extracted types (including the types
+      # that close a dependency cycle) are already in `schema_objs`.
+      if type_name in schema_objs:
+        continue
+
+      if isinstance(current, Descriptor):
+        self._ExtractMessageSchema(current, worklist)
+      elif isinstance(current, EnumDescriptor):
+        self._ExtractEnumSchema(current)
+      else:
+        raise TypeError(f"Don't know how to handle type \"{type_name}\" "
+                        f"which is not a protobuf message Descriptor, "
+                        f"nor an EnumDescriptor, nor a primitive type.")
+
+  def _ExtractSchemas(
+      self,
+      router_methods: Dict[str, Any],
+  ) -> None:
+    """Extracts OpenAPI schemas for all the used protobuf types."""
+    # Holds OpenAPI representations of types, seeded with the shared
+    # primitive types schemas.
+    self.schema_objs = dict(_PRIMITIVE_TYPES_SCHEMAS)
+
+    for method_metadata in router_methods.values():
+      args_type = method_metadata.args_type
+      if args_type:
+        self._ExtractSchema(args_type)
+
+      result_type = method_metadata.result_type
+      if (result_type and
+          result_type != method_metadata.BINARY_STREAM_RESULT_TYPE):
+        self._ExtractSchema(result_type)
+
+  def _SetMetadata(self) -> None:
+    """Sets the fixed fields of the root OpenAPI object."""
+    self.openapi_obj["openapi"] = _OPENAPI_SPECIFICATION_VERSION
+
+    # The GRR version is the only dynamic `info` field, so the static part is
+    # shared and only a shallow copy is made to add the version to it.
+    version_dict = version.Version()
+    info_obj = dict(_INFO_OBJ)
+    info_obj["version"] = (f"{version_dict['major']}."
+                           f"{version_dict['minor']}."
+                           f"{version_dict['revision']}."
+                           f"{version_dict['release']}")
+
+    self.openapi_obj["info"] = info_obj
+
+    self.openapi_obj["servers"] = _SERVERS_OBJ
+
+  def _SetComponents(self) -> None:
+    """Sets the `components` field of the root OpenAPI object."""
+    if self.schema_objs is None:
+      raise AssertionError("Called _SetComponents before extracting the types "
+                           "schemas.")
+
+    # All the extracted schemas, primitives included, go into the
+    # `components` object: their usage sites hold `$ref` objects.
+    self.openapi_obj["components"] = {"schemas": self.schema_objs}
+
+  def _SetEndpoints(
+      self,
+      router_methods: Dict[str, Any],
+  ) -> None:
+    """Sets the `paths` field of the root OpenAPI object."""
+    paths_obj = dict()
+
+    # Loop-invariant lookups, hoisted out of the (hot) routes loops.
+    quote_from_bytes = urlparse.quote_from_bytes
+    parse_path = _ParsePath
+    get_type_name = _GetTypeName
+    get_schema_or_ref = _GetSchemaOrReferenceObject
+    label_repeated = FieldDescriptor.LABEL_REPEATED
+
+    for router_method_name, router_method in router_methods.items():
+      # None of the following depends on the HTTP verb or on the route path,
+      # so it is computed once per router method, not once per route.
+      if router_method.args_type:
+        field_descriptors = router_method.args_type.protobuf.DESCRIPTOR.fields
+      else:
+        field_descriptors = ()
+
+      tags = [router_method.category or "NoCategory"]
+      description = router_method.doc or "No description."
+
+      if router_method.result_type:
+        if (router_method.result_type ==
+            router_method.BINARY_STREAM_RESULT_TYPE):
+          media_type = "application/octet-stream"
+          schema_or_ref_obj = _GetSchemaOrReferenceObject("BinaryStream")
+        else:
+          media_type = "application/json"
+          schema_or_ref_obj = _GetSchemaOrReferenceObject(
+              _GetTypeName(router_method.result_type.protobuf.DESCRIPTOR))
+
+        response_200_obj = {
+            "description": (
+                f"The call to the {router_method_name} API method succeeded "
+                f"and it returned an instance of "
+                f"{_GetTypeName(router_method.result_type)}."),
+            "content": {
+                media_type: {
+                    "schema": schema_or_ref_obj,
+                },
+            },
+        }
+      else:
+        response_200_obj = {
+            "description": (f"The call to the {router_method_name} API "
+                            f"method succeeded."),
+        }
+
+      # Single-shot literals: the dicts are allocated at their final sizes
+      # instead of being grown key by key.
+      responses_obj = {
+          "200": response_200_obj,
+          "default": {
+              "description": (f"The call to the {router_method_name} API "
+                              f"method did not succeed."),
+          },
+      }
+
+      # The split of argument fields into path and non-path parameters
+      # depends only on the route path, so it is computed once per path and
+      # shared between the HTTP verbs routed through it.
+      triage_by_path = {}
+
+      for http_method, path, unused_strip_root_types in (
+          router_method.http_methods):
+        simple_path, path_args = parse_path(path)
+
+        path_obj = paths_obj.setdefault(simple_path, {})
+
+        triaged = triage_by_path.get(path)
+        if triaged is None:
+          triaged = (
+              [
+                  field_descriptor for field_descriptor in field_descriptors
+                  if field_descriptor.name in path_args
+              ],
+              [
+                  field_descriptor for field_descriptor in field_descriptors
+                  if field_descriptor.name not in path_args
+              ],
+          )
+          triage_by_path[path] = triaged
+        path_params, non_path_params = triaged
+
+        # Non-path fields are query parameters for read requests and request
+        # body parameters otherwise.
+        if http_method.upper() in ("GET", "HEAD"):
+          query_params = non_path_params
+          body_params = []
+        else:
+          query_params = []
+          body_params = non_path_params
+
+        normalized_path = path.translate(_OPERATION_ID_TRANSLATION)
+
+        parameters = [
+            {
+                "name": field_descriptor.name,
+                "in": "path",
+                "required": True,
+                "schema": get_schema_or_ref(get_type_name(field_descriptor)),
+            } for field_descriptor in path_params
+        ] + [
+            {
+                "name": field_descriptor.name,
+                "in": "query",
+                "schema": get_schema_or_ref(get_type_name(field_descriptor)),
+            } for field_descriptor in query_params
+        ]
+
+        operation_obj = {
+            "tags": tags,
+            "description": description,
+            # `quote_from_bytes` is what `quote` delegates to after encoding;
+            # calling it directly on the UTF-8 encoded id skips the wrapper's
+            # type dispatch and default-argument handling. The output matches
+            # `quote` with an empty safe set; the translated path no longer
+            # contains "/" anyway.
+            "operationId": quote_from_bytes(
+                (f"{http_method}-{normalized_path}-"
+                 f"{router_method_name}").encode("utf-8"),
+                safe=b""),
+            "parameters": parameters,
+            "responses": responses_obj,
+        }
+
+        if body_params:
+          operation_obj["requestBody"] = {
+              "content": {
+                  "application/json": {
+                      "schema": {
+                          "type": "object",
+                          "properties": {
+                              field_descriptor.name:
+                                  get_schema_or_ref(
+                                      get_type_name(field_descriptor),
+                                      field_descriptor.label ==
+                                      label_repeated)
+                              for field_descriptor in body_params
+                          },
+                      },
+                  },
+              },
+          }
+
+        path_obj[http_method.lower()] = operation_obj
+
+    self.openapi_obj["paths"] = paths_obj
+
+  def Handle(
+      self,
+      args: None,
+      token: Optional[access_control.ACLToken] = None,
+  ) -> ApiGetOpenApiDescriptionResult:
+    """Handle requests for the OpenAPI description of the GRR API."""
+    del args, token  # Unused.
+
+    result = ApiGetOpenApiDescriptionResult()
+    result.openapi_description = self.openapi_json
+    return result
+
+  def _GetOrBuildOpenApiJson(self) -> str:
+    """Returns the serialized OpenAPI description, building it if needed."""
+    router_cls = self.router.__class__
+    openapi_json = _openapi_descriptions.get(router_cls)
+    if openapi_json is None:
+      # Double-checked locking: without it, concurrent constructions would
+      # each build the whole description. The lock is contended at most once
+      # per router class for the lifetime of the process.
+      with _openapi_descriptions_lock:
+        openapi_json = _openapi_descriptions.get(router_cls)
+        if openapi_json is None:
+          openapi_json = self._BuildOpenApiDescription()
+          _openapi_descriptions[router_cls] = openapi_json
+
+    return openapi_json
+
+  def _BuildOpenApiDescription(self) -> str:
+    """Builds and serializes the OpenAPI description of the router's API."""
+    self.openapi_obj = dict()
+    # `GetAnnotatedMethods` does non-trivial reflection, so it is called once
+    # and its result shared by the build steps that need it.
+    router_methods = self.router.__class__.GetAnnotatedMethods()
+    self._ExtractSchemas(router_methods)
+    self._SetMetadata()
+    self._SetComponents()
+    self._SetEndpoints(router_methods)
+
+    # Only the serialized description outlives this method: the dict trees
+    # are dropped from the handler so the allocator can reclaim them once
+    # serialization is done, instead of them staying resident for the
+    # lifetime of the handler.
+    openapi_obj = self.openapi_obj
+    self.openapi_obj = None
+    self.schema_objs = None
+
+    if orjson is not None:
+      # `orjson.dumps` returns `bytes`, but the result protobuf field is a
+      # string, hence the decoding step. The field cannot be changed to
+      # `bytes` to skip the decode: the API value renderers base64-encode
+      # `bytes` fields when rendering results to JSON, which would change
+      # the response shape for existing consumers. The decode runs once per
+      # router class anyway, as the serialized description is cached.
+      return orjson.dumps(openapi_obj).decode("utf-8")
+
+    # Compact separators and raw UTF-8 match the `orjson` output: no
+    # whitespace padding after "," and ":" and no ASCII escaping pass, which
+    # keeps the cached string (and every response) smaller.
+    return json.dumps(openapi_obj, separators=(",", ":"), ensure_ascii=False)
@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# Lint as: python3
+"""This module contains tests for metadata API handlers."""
+import json
+
+from absl import app
+
+from grr_response_server.gui import api_call_router
+from grr_response_server.gui import api_test_lib
+
+from grr_response_server.gui.api_plugins import metadata as metadata_plugin
+
+from grr.test_lib import test_lib
+
+
+class MetadataDummyApiCallRouter(api_call_router.ApiCallRouter):
+  """Dummy `ApiCallRouter` implementation used for OpenAPI testing."""
+
+  @api_call_router.Http("GET", "/api/method1")
+  @api_call_router.ArgsType(api_test_lib.SampleGetHandlerArgs)
+  def SomeRandomMethodWithArgsType(self, args, token=None):
+    """Doc 1."""
+
+  @api_call_router.Http("GET", "/api/method2/<path:path>")
+  @api_call_router.ArgsType(api_test_lib.SampleGetHandlerArgs)
+  @api_call_router.ResultType(api_test_lib.SampleGetHandlerArgs)
+  def SomeRandomMethodWithArgsTypeAndResultType(self, args, token=None):
+    """Doc 2."""
+
+
+class ApiGetOpenApiDescriptionHandlerTest(api_test_lib.ApiCallHandlerTest):
+  """Test for `ApiGetOpenApiDescriptionHandler`."""
+
+  def setUp(self):
+    super().setUp()
+    self.router = MetadataDummyApiCallRouter()
+    self.handler = metadata_plugin.ApiGetOpenApiDescriptionHandler(self.router)
+
+    result = self.handler.Handle(None, token=self.token)
+    self.openapi_desc = result.openapi_description
+    self.openapi_desc_dict = json.loads(self.openapi_desc)
+
+  def testRendersValidOpenApiDescription(self):
+    # The OpenAPI specification requires the `openapi`, `info` and `paths`
+    # fields of the root object.
+    self.assertIn("openapi", self.openapi_desc_dict)
+    self.assertIn("info", self.openapi_desc_dict)
+    self.assertIn("paths", self.openapi_desc_dict)
+
+  def testRoutesAreSimplifiedAndPresent(self):
+    paths_obj = self.openapi_desc_dict["paths"]
+
+    self.assertIn("/api/method1", paths_obj)
+    self.assertIn("get", paths_obj["/api/method1"])
+    # Werkzeug converter syntax is replaced by OpenAPI path parameter syntax.
+    self.assertIn("/api/method2/{path}", paths_obj)
+
+  def testPathArgsAreExtractedAsPathParameters(self):
+    operation_obj = (
+        self.openapi_desc_dict["paths"]["/api/method2/{path}"]["get"])
+
+    path_parameters = [
+        parameter_obj["name"]
+        for parameter_obj in operation_obj["parameters"]
+        if parameter_obj["in"] == "path"
+    ]
+    self.assertEqual(path_parameters, ["path"])
+
+  def testRouteArgsTypesAreExtractedAsComponentsSchemas(self):
+    schemas_obj = self.openapi_desc_dict["components"]["schemas"]
+
+    self.assertIn("SampleGetHandlerArgs", " ".join(schemas_obj))
+
+  def testRepeatedCallsRenderTheSameDescription(self):
+    result = self.handler.Handle(None, token=self.token)
+
+    self.assertEqual(self.openapi_desc, result.openapi_description)
+
+
+def main(argv):
+  test_lib.main(argv)
+
+
+if __name__ == "__main__":
+  app.run(main)
@@ -0,0 +1,35 @@
+#!/usr/bin/env python
+# Lint as: python3
+"""Tool used by Travis to save the OpenAPI description of the GRR API."""
+
+from absl import app
+from absl import flags
+
+from grr_response_core import config
+from grr_response_core.config import contexts
+from grr_response_server import server_startup
+from grr_response_server.gui import api_call_router_without_checks
+from grr_response_server.gui.api_plugins import metadata as api_metadata
+
+flags.DEFINE_string("local_json_path", "/tmp/openapi_description.json",
+                    "Path of the file where the OpenAPI description is saved.")
+
+
+def main(argv):
+  del argv  # Unused.
+
+  config.CONFIG.AddContext(contexts.COMMAND_LINE_CONTEXT)
+  server_startup.Init()
+
+  router = api_call_router_without_checks.ApiCallRouterWithoutChecks()
+  handler = api_metadata.ApiGetOpenApiDescriptionHandler(router)
+
+  # The handler serializes the description once at construction and keeps
+  # only the resulting JSON string, so it is written to disk as is, without
+  # a second serialization pass or another copy of the document.
+  with open(flags.FLAGS.local_json_path, "w", encoding="utf-8") as file:
+    file.write(handler.openapi_json)
+
+
+if __name__ == "__main__":
+  app.run(main)